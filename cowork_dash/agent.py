@@ -1,9 +1,6 @@
+import functools
 import os
 
-from deepagents import create_deep_agent
-from deepagents.backends import FilesystemBackend
-from langgraph.checkpoint.memory import InMemorySaver
-
 from cowork_dash.tools import (
     add_to_canvas,
     bash,
@@ -93,10 +90,6 @@ Work iteratively like a human using Jupyter:
 
 The workspace is your sandbox - feel free to create files, organize content, and help users manage their projects."""
 
-# Get workspace root from environment variable or default to current directory
-workspace_root = os.getenv("DEEPAGENT_WORKSPACE_ROOT", os.getcwd())
-backend = FilesystemBackend(root_dir=workspace_root, virtual_mode=True)
-
 # Default tools list used by both global and session agents
 AGENT_TOOLS = [
     add_to_canvas,
@@ -114,16 +107,38 @@ AGENT_TOOLS = [
     clear_notebook_canvas_items,
 ]
 
-# Global agent for physical filesystem mode
-# This uses FilesystemBackend which writes to disk
-agent = create_deep_agent(
-    system_prompt=SYSTEM_PROMPT,
-    name="Cowork Dash",
-    backend=backend,
-    tools=AGENT_TOOLS,
-    interrupt_on=dict(bash=True),
-    checkpointer=InMemorySaver()
-)
+
+@functools.cache
+def get_agent():
+    """Get the global agent for physical filesystem mode.
+
+    The agent uses FilesystemBackend which writes to disk. It is built on
+    first use so that importing this module (e.g. for create_session_agent
+    in virtual FS mode) does not pay for DeepAgents imports and agent setup.
+    """
+    from deepagents import create_deep_agent
+    from deepagents.backends import FilesystemBackend
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    # Get workspace root from environment variable or default to current directory
+    workspace_root = os.getenv("DEEPAGENT_WORKSPACE_ROOT", os.getcwd())
+    backend = FilesystemBackend(root_dir=workspace_root, virtual_mode=True)
+
+    return create_deep_agent(
+        system_prompt=SYSTEM_PROMPT,
+        name="Cowork Dash",
+        backend=backend,
+        tools=AGENT_TOOLS,
+        interrupt_on=dict(bash=True),
+        checkpointer=InMemorySaver()
+    )
+
+
+def __getattr__(name: str):
+    # Keep the "agent.py:agent" spec working while deferring construction
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_session_agent(session_id: str):
@@ -138,6 +153,9 @@ def create_session_agent(session_id: str):
     Returns:
         A configured deep agent that uses VirtualFilesystemBackend.
     """
+    from deepagents import create_deep_agent
+    from langgraph.checkpoint.memory import InMemorySaver
+
     from .backends import VirtualFilesystemBackend
     from .virtual_fs import get_session_manager
 
@@ -5,8 +5,10 @@ BackendProtocol interface using the existing VirtualFilesystem for storage.
 This enables unified file access between the agent and Dash UI in virtual FS mode.
 """
 
-import fnmatch
+import functools
 import re
+import sys
+from typing import Callable
 
 from deepagents.backends.protocol import (
     BackendProtocol,
@@ -23,7 +25,86 @@ from deepagents.backends.utils import (
     perform_string_replacement,
 )
 
-from .virtual_fs import VirtualFilesystem
+from .virtual_fs import VirtualFilesystem, _compile_glob
+
+_SLASH_RE = re.compile(r"/{2,}")
+
+# Line boundaries that str.splitlines() honours besides "\n"
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _matching_lines(content: str, pattern: str) -> list[tuple[int, str]]:
+    """Return (line_number, line) pairs for lines of content containing pattern.
+
+    Line numbers follow content.splitlines(). For plain "\n"-separated text
+    the matches are located with str.find over the whole buffer, so only
+    matching lines are ever sliced out.
+    """
+    if "\n" in pattern:
+        return []
+
+    if not pattern or _OTHER_LINE_BREAKS_RE.search(content):
+        return [
+            (line_num, line)
+            for line_num, line in enumerate(content.splitlines(), 1)
+            if pattern in line
+        ]
+
+    results = []
+    line_num = 1
+    counted_to = 0
+    idx = content.find(pattern)
+    while idx != -1:
+        line_start = content.rfind("\n", 0, idx) + 1
+        line_end = content.find("\n", idx)
+        if line_end == -1:
+            line_end = len(content)
+
+        line_num += content.count("\n", counted_to, line_start)
+        counted_to = line_start
+        results.append((line_num, content[line_start:line_end]))
+
+        # At most one match per line, like the per-line scan
+        idx = content.find(pattern, line_end + 1)
+
+    return results
+
+
+def _make_path_normalizer(root: str) -> Callable[[str], str]:
+    """Build a path normalizer specialized to a fixed filesystem root.
+
+    The returned function makes a path absolute and within root. The root and
+    its slash-terminated prefix are bound as closure constants, so a call does
+    no attribute lookups.
+    """
+    root = sys.intern(root)
+    root_slash = root if root == "/" else root + "/"
+    sub_slashes = _SLASH_RE.sub
+
+    def normalize_path(path: str) -> str:
+        if not path:
+            return root
+
+        # If path doesn't start with /, treat it as relative to the FS root
+        if path[0] != "/":
+            path = root_slash + path
+        # If path starts with / but is not the FS root or inside it, prepend the root
+        elif path != root and not path.startswith(root_slash):
+            # Strip leading / and prepend root
+            path = root_slash + path.lstrip("/")
+
+        # Remove trailing slash except for root
+        if path != root and path.endswith("/"):
+            path = path.rstrip("/")
+
+        # Collapse duplicate slashes; the substring check keeps the regex off
+        # the common path
+        if "//" in path:
+            path = sub_slashes("/", path)
+
+        return path
+
+    return normalize_path
 
 
 class VirtualFilesystemBackend(BackendProtocol):
@@ -52,25 +133,11 @@ class VirtualFilesystemBackend(BackendProtocol):
                 should be shared with Dash callbacks for unified access.
         """
         self.fs = fs
-
-    def _normalize_path(self, path: str) -> str:
-        """Ensure path is absolute and within the VirtualFilesystem root."""
-        if not path:
-            return self.fs._root
-
-        # If path doesn't start with /, treat it as relative to the FS root
-        if not path.startswith("/"):
-            path = f"{self.fs._root}/{path}"
-        # If path starts with / but not with the FS root, prepend the root
-        elif not path.startswith(self.fs._root):
-            # Strip leading / and prepend root
-            path = f"{self.fs._root}/{path.lstrip('/')}"
-
-        # Remove trailing slash except for root
-        if path != self.fs._root and path.endswith("/"):
-            path = path.rstrip("/")
-
-        return path
+        # Normalization is pure for a fixed root and every entrypoint calls it,
+        # usually with the same handful of paths, so memoize it per backend
+        self._normalize_path = functools.lru_cache(maxsize=4096)(
+            _make_path_normalizer(fs._root)
+        )
 
     def ls_info(self, path: str) -> list[FileInfo]:
         """List files and directories in path.
@@ -83,36 +150,20 @@ class VirtualFilesystemBackend(BackendProtocol):
         """
         norm_path = self._normalize_path(path)
 
-        if not self.fs.is_dir(norm_path):
+        try:
+            entries = self.fs.listdir_info(norm_path)
+        except FileNotFoundError:
             return []
 
+        base = "" if norm_path == "/" else norm_path
         results: list[FileInfo] = []
-        try:
-            for name in self.fs.listdir(norm_path):
-                if norm_path == "/":
-                    full_path = f"/{name}"
-                else:
-                    full_path = f"{norm_path}/{name}"
-
-                is_dir = self.fs.is_dir(full_path)
-
-                info: FileInfo = {
-                    "path": full_path + ("/" if is_dir else ""),
-                    "is_dir": is_dir,
-                }
-
-                if not is_dir:
-                    try:
-                        content = self.fs.read_bytes(full_path)
-                        info["size"] = len(content)
-                    except Exception:
-                        info["size"] = 0
-                else:
-                    info["size"] = 0
-
-                results.append(info)
-        except FileNotFoundError:
-            pass
+        for name, is_dir, size in entries:
+            full_path = f"{base}/{name}"
+            results.append({
+                "path": full_path + ("/" if is_dir else ""),
+                "is_dir": is_dir,
+                "size": size,
+            })
 
         results.sort(key=lambda x: x.get("path", ""))
         return results
@@ -247,20 +298,19 @@ class VirtualFilesystemBackend(BackendProtocol):
         """Search file contents for pattern.
 
         Args:
-            pattern: Literal string to search for (NOT regex per protocol,
-                    but we use regex internally for flexibility).
+            pattern: Literal string to search for (NOT regex per protocol).
             path: Optional directory path to search in.
             glob: Optional glob pattern to filter which files to search.
 
         Returns:
             List of GrepMatch dicts on success, or error string.
         """
-        try:
-            regex = re.compile(re.escape(pattern))  # Escape for literal matching
-        except re.error as e:
-            return f"Invalid pattern: {e}"
+        # UTF-8 text contains the pattern only if its bytes contain the encoded
+        # pattern, so files can be rejected without decoding them
+        needle = pattern.encode("utf-8")
 
         norm_path = self._normalize_path(path or "/")
+        glob_match = _compile_glob(glob) if glob else None
         matches: list[GrepMatch] = []
 
         def search_dir(dir_path: str) -> None:
@@ -282,18 +332,20 @@ class VirtualFilesystemBackend(BackendProtocol):
                     search_dir(full_path)
                 elif self.fs.is_file(full_path):
                     # Apply glob filter if provided
-                    if glob and not fnmatch.fnmatch(name, glob):
+                    if glob_match and not glob_match(name):
                         continue
 
                     try:
-                        content = self.fs.read_text(full_path)
-                        for line_num, line in enumerate(content.splitlines(), 1):
-                            if regex.search(line):
-                                matches.append({
-                                    "path": full_path,
-                                    "line": line_num,
-                                    "text": line,
-                                })
+                        data = self.fs.read_bytes(full_path)
+                        if needle not in data:
+                            continue
+                        content = data.decode("utf-8")
+                        for line_num, line in _matching_lines(content, pattern):
+                            matches.append({
+                                "path": full_path,
+                                "line": line_num,
+                                "text": line,
+                            })
                     except Exception:
                         pass  # Skip binary or unreadable files
 
@@ -312,57 +364,46 @@ class VirtualFilesystemBackend(BackendProtocol):
         """
         norm_path = self._normalize_path(path)
 
-        if not self.fs.is_dir(norm_path):
+        try:
+            root_entries = self.fs.listdir_info(norm_path)
+        except FileNotFoundError:
             return []
 
-        results: list[FileInfo] = []
+        match = _compile_glob(pattern)
+        # Recurse into directories for * and ** patterns
+        recurse = "*" in pattern
 
-        def search_dir(dir_path: str, relative_base: str) -> None:
-            if not self.fs.is_dir(dir_path):
-                return
+        results: list[FileInfo] = []
 
-            try:
-                entries = self.fs.listdir(dir_path)
-            except Exception:
-                return
+        def pending(dir_path: str, relative_base: str, entries) -> list:
+            base = "" if dir_path == "/" else dir_path
+            prefix = f"{relative_base}/" if relative_base else ""
+            # Reversed so popping from the stack visits entries in sorted order
+            return [
+                (f"{base}/{name}", f"{prefix}{name}", name, is_dir, size)
+                for name, is_dir, size in reversed(entries)
+            ]
+
+        # Explicit stack walk; yields the same depth-first order as recursion
+        stack = pending(norm_path, "", root_entries)
+        while stack:
+            full_path, relative_path, name, is_dir, size = stack.pop()
+
+            # Check if this entry matches the pattern
+            if match(relative_path) or match(name):
+                results.append({
+                    "path": full_path + "/" if is_dir else full_path,
+                    "is_dir": is_dir,
+                    "size": size,
+                })
 
-            for name in entries:
-                if dir_path == "/":
-                    full_path = f"/{name}"
-                else:
-                    full_path = f"{dir_path}/{name}"
+            if is_dir and recurse:
+                try:
+                    entries = self.fs.listdir_info(full_path)
+                except FileNotFoundError:
+                    continue
+                stack.extend(pending(full_path, relative_path, entries))
 
-                if relative_base:
-                    relative_path = f"{relative_base}/{name}"
-                else:
-                    relative_path = name
-
-                is_dir = self.fs.is_dir(full_path)
-
-                # Check if this entry matches the pattern
-                if fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(name, pattern):
-                    if is_dir:
-                        results.append({
-                            "path": full_path + "/",
-                            "is_dir": True,
-                            "size": 0,
-                        })
-                    else:
-                        try:
-                            size = len(self.fs.read_bytes(full_path))
-                        except Exception:
-                            size = 0
-                        results.append({
-                            "path": full_path,
-                            "is_dir": False,
-                            "size": size,
-                        })
-
-                # Recurse into directories for ** patterns
-                if is_dir and ("**" in pattern or "*" in pattern):
-                    search_dir(full_path, relative_path)
-
-        search_dir(norm_path, "")
         return results
 
     def upload_files(self, files: list[tuple[str, bytes]]) -> list[FileUploadResponse]:
@@ -375,18 +416,28 @@ class VirtualFilesystemBackend(BackendProtocol):
             List of FileUploadResponse objects, one per input file.
         """
         responses: list[FileUploadResponse] = []
+        # Parent directory -> whether it exists (or was created); batches of
+        # uploads usually share a few parents, so check/create each only once
+        parent_ready: dict[str, bool] = {}
 
         for path, content in files:
             norm_path = self._normalize_path(path)
 
             # Ensure parent directory exists
-            parent = "/".join(norm_path.split("/")[:-1]) or "/"
-            if parent != "/" and not self.fs.is_dir(parent):
-                try:
-                    self.fs.mkdir(parent, parents=True, exist_ok=True)
-                except Exception:
-                    responses.append(FileUploadResponse(path=path, error="invalid_path"))
-                    continue
+            parent = norm_path.rpartition("/")[0] or "/"
+            ready = parent_ready.get(parent)
+            if ready is None:
+                ready = True
+                if parent != "/" and not self.fs.is_dir(parent):
+                    try:
+                        self.fs.mkdir(parent, parents=True, exist_ok=True)
+                    except Exception:
+                        ready = False
+                parent_ready[parent] = ready
+
+            if not ready:
+                responses.append(FileUploadResponse(path=path, error="invalid_path"))
+                continue
 
             try:
                 self.fs.write_bytes(norm_path, content)
@@ -8,7 +8,7 @@ import io
 import json
 import base64
 import re
-import uuid
+import secrets
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
@@ -23,11 +23,24 @@ except (ImportError, AttributeError):
 
 from .virtual_fs import VirtualFilesystem, VirtualPath
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Type alias for paths that work with both physical and virtual filesystems
 AnyPath = Union[Path, VirtualPath]
 AnyRoot = Union[Path, VirtualFilesystem]
 
+# Patterns used when parsing canvas objects and canvas.md, compiled once
+_MERMAID_INPUT_RE = re.compile(r'```mermaid\s*\n?(.*?)```', re.DOTALL | re.IGNORECASE)
+_MERMAID_BLOCK_RE = re.compile(r'```mermaid\s*\n(.*?)```', re.DOTALL | re.IGNORECASE)
+_PLOTLY_BLOCK_RE = re.compile(r'```plotly\s*\n([^\n]+)\n```')
+_IMAGE_REF_RE = re.compile(r'!\[.*?\]\(([^)]+)\)')
+_TABLE_RE = re.compile(r'<table.*?</table>', re.DOTALL)
+_CANVAS_ITEM_RE = re.compile(r'<!-- canvas-item: ({.*?}) -->')
+
 
 def _get_path(root: AnyRoot, path: str = "") -> AnyPath:
     """Get a path object from root, handling both Path and VirtualFilesystem."""
@@ -37,9 +50,21 @@ def _get_path(root: AnyRoot, path: str = "") -> AnyPath:
         return root / path if path else root
 
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by json.dumps may hold NaN/Infinity, which only
+            # the stdlib parser accepts
+            pass
+    return json.loads(data)
+
+
 def generate_canvas_id() -> str:
     """Generate a unique ID for a canvas item."""
-    return f"canvas_{uuid.uuid4().hex[:8]}"
+    return f"canvas_{secrets.token_hex(4)}"
 
 
 def parse_canvas_object(
@@ -83,8 +108,40 @@ def parse_canvas_object(
     canvas_dir = _get_path(workspace_root, ".canvas")
     canvas_dir.mkdir(exist_ok=True)
 
+    # Markdown string - check for Mermaid diagrams - keep inline
+    # Checked first: strings are the most common input, and builtin type
+    # checks are cheaper than the module-name probes below
+    if isinstance(obj, str):
+        # Check if it's a Mermaid diagram - more flexible pattern
+        match = _MERMAID_INPUT_RE.search(obj)
+        if match:
+            mermaid_code = match.group(1).strip()
+            return add_metadata({
+                "type": "mermaid",
+                "data": mermaid_code
+            })
+
+        return add_metadata({
+            "type": "markdown",
+            "data": obj
+        })
+
+    # Plotly dict format - save to file
+    elif isinstance(obj, dict) and ('data' in obj or 'layout' in obj):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filename = f"plotly_{timestamp}.json"
+        filepath = canvas_dir / filename
+
+        filepath.write_text(json.dumps(obj, indent=2))
+
+        return add_metadata({
+            "type": "plotly",
+            "file": filename,  # Relative to .canvas/ directory where canvas.md lives
+            "data": obj  # Keep for current session rendering
+        })
+
     # Pandas DataFrame - keep inline
-    if module.startswith('pandas') and obj_type == 'DataFrame':
+    elif module.startswith('pandas') and obj_type == 'DataFrame':
         return add_metadata({
             "type": "dataframe",
             "data": obj.to_dict('records'),
@@ -123,7 +180,7 @@ def parse_canvas_object(
         filename = f"plotly_{timestamp}.json"
         filepath = canvas_dir / filename
 
-        plotly_data = json.loads(obj.to_json())
+        plotly_data = _json_loads(obj.to_json())
         filepath.write_text(json.dumps(plotly_data, indent=2))
 
         return add_metadata({
@@ -157,38 +214,6 @@ def parse_canvas_object(
             "data": img_base64  # Keep for current session rendering
         })
 
-    # Plotly dict format - save to file
-    elif isinstance(obj, dict) and ('data' in obj or 'layout' in obj):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"plotly_{timestamp}.json"
-        filepath = canvas_dir / filename
-
-        filepath.write_text(json.dumps(obj, indent=2))
-
-        return add_metadata({
-            "type": "plotly",
-            "file": filename,  # Relative to .canvas/ directory where canvas.md lives
-            "data": obj  # Keep for current session rendering
-        })
-
-    # Markdown string - check for Mermaid diagrams - keep inline
-    elif isinstance(obj, str):
-        # Check if it's a Mermaid diagram
-        if re.search(r'```mermaid', obj, re.IGNORECASE):
-            # Extract mermaid code - more flexible pattern
-            match = re.search(r'```mermaid\s*\n?(.*?)```', obj, re.DOTALL | re.IGNORECASE)
-            if match:
-                mermaid_code = match.group(1).strip()
-                return add_metadata({
-                    "type": "mermaid",
-                    "data": mermaid_code
-                })
-
-        return add_metadata({
-            "type": "markdown",
-            "data": obj
-        })
-
     # Unknown type - convert to string - keep inline
     else:
         return add_metadata({
@@ -304,14 +329,13 @@ def load_canvas_from_markdown(
     canvas_dir = canvas_md.parent
 
     # First, find all metadata comments to get item boundaries and metadata
-    metadata_pattern = r'<!-- canvas-item: ({.*?}) -->'
-    metadata_matches = list(re.finditer(metadata_pattern, content))
+    metadata_matches = list(_CANVAS_ITEM_RE.finditer(content))
 
     # If we have metadata comments, use them to parse items
     if metadata_matches:
         for i, match in enumerate(metadata_matches):
             try:
-                metadata = json.loads(match.group(1))
+                metadata = _json_loads(match.group(1))
             except json.JSONDecodeError:
                 metadata = {"id": generate_canvas_id()}
 
@@ -355,23 +379,23 @@ def _parse_item_content(
         content = re.sub(title_pattern, '', content, count=1).strip()
 
     if item_type == "mermaid":
-        match = re.search(r'```mermaid\s*\n(.*?)```', content, re.DOTALL | re.IGNORECASE)
+        match = _MERMAID_BLOCK_RE.search(content)
         if match:
             item["data"] = match.group(1).strip()
             return item
 
     elif item_type == "plotly":
-        match = re.search(r'```plotly\s*\n([^\n]+)\n```', content)
+        match = _PLOTLY_BLOCK_RE.search(content)
         if match:
             file_ref = match.group(1).strip()
             file_path = canvas_dir / file_ref
             if file_path.exists():
                 item["file"] = file_ref
-                item["data"] = json.loads(file_path.read_text())
+                item["data"] = _json_loads(file_path.read_bytes())
                 return item
 
     elif item_type in ("matplotlib", "image"):
-        match = re.search(r'!\[.*?\]\(([^)]+)\)', content)
+        match = _IMAGE_REF_RE.search(content)
         if match:
             file_ref = match.group(1)
             if not file_ref.startswith('data:'):
@@ -384,7 +408,7 @@ def _parse_item_content(
                     return item
 
     elif item_type == "dataframe":
-        match = re.search(r'<table.*?</table>', content, re.DOTALL)
+        match = _TABLE_RE.search(content)
         if match:
             item["html"] = match.group(0)
             return item
@@ -405,7 +429,7 @@ def _parse_legacy_canvas(content: str, canvas_dir: AnyPath) -> List[Dict]:
     code_blocks = []
 
     # Find all mermaid blocks
-    for match in re.finditer(r'```mermaid\s*\n(.*?)```', content, re.DOTALL | re.IGNORECASE):
+    for match in _MERMAID_BLOCK_RE.finditer(content):
         code_blocks.append({
             'type': 'mermaid',
             'start': match.start(),
@@ -414,7 +438,7 @@ def _parse_legacy_canvas(content: str, canvas_dir: AnyPath) -> List[Dict]:
         })
 
     # Find all plotly blocks
-    for match in re.finditer(r'```plotly\s*\n([^\n]+)\n```', content, re.DOTALL):
+    for match in _PLOTLY_BLOCK_RE.finditer(content):
         code_blocks.append({
             'type': 'plotly_file',
             'start': match.start(),
@@ -423,7 +447,7 @@ def _parse_legacy_canvas(content: str, canvas_dir: AnyPath) -> List[Dict]:
         })
 
     # Find all image references
-    for match in re.finditer(r'!\[.*?\]\(([^)]+)\)', content):
+    for match in _IMAGE_REF_RE.finditer(content):
         file_ref = match.group(1)
         if not file_ref.startswith('data:'):
             code_blocks.append({
@@ -434,7 +458,7 @@ def _parse_legacy_canvas(content: str, canvas_dir: AnyPath) -> List[Dict]:
             })
 
     # Find all HTML tables
-    for match in re.finditer(r'<table.*?</table>', content, re.DOTALL):
+    for match in _TABLE_RE.finditer(content):
         code_blocks.append({
             'type': 'table',
             'start': match.start(),
@@ -470,7 +494,7 @@ def _parse_legacy_canvas(content: str, canvas_dir: AnyPath) -> List[Dict]:
             if file_path.exists():
                 item["type"] = "plotly"
                 item["file"] = block['content']
-                item["data"] = json.loads(file_path.read_text())
+                item["data"] = _json_loads(file_path.read_bytes())
                 canvas_items.append(item)
         elif block['type'] == 'image_file':
             file_path = canvas_dir / block['content']
@@ -945,6 +945,18 @@ def remove_canvas_item(item_id: str) -> Dict[str, Any]:
 # BASH TOOL
 # =============================================================================
 
+def _decode_output(data: bytes) -> str:
+    """Decode subprocess output like text=True would, without failing on bad bytes.
+
+    Invalid UTF-8 becomes U+FFFD, and \r\n / \r line endings are translated
+    to \n as universal newlines mode does.
+    """
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def bash(command: str, timeout: int = 60) -> Dict[str, Any]:
     """Execute a bash command and return the output.
 
@@ -988,18 +1000,19 @@ def bash(command: str, timeout: int = 60) -> Dict[str, Any]:
         }
 
     try:
+        # Capture raw bytes and decode here: text=True would raise on
+        # non-UTF-8 output (e.g. `cat` on a binary file)
         result = subprocess.run(
             command,
             shell=True,
             cwd=str(WORKSPACE_ROOT),
             capture_output=True,
-            text=True,
             timeout=timeout
         )
 
         return {
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": _decode_output(result.stdout),
+            "stderr": _decode_output(result.stderr),
             "return_code": result.returncode,
             "status": "success" if result.returncode == 0 else "error"
         }
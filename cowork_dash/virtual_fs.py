@@ -5,71 +5,149 @@ between different user sessions. Each session gets its own virtual workspace
 that is automatically cleaned up when the session ends.
 """
 
+import fnmatch
+import functools
+import re
 import threading
 import time
 import uuid
 from datetime import datetime
-from pathlib import PurePosixPath
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_path(root: str, path: str) -> str:
+    """Normalize path to absolute form under root.
+
+    Pure in (root, path), so results are shared across filesystem instances;
+    every VirtualFilesystem operation starts here, usually with a path it has
+    seen before.
+    """
+    if not path.startswith("/"):
+        path = f"{root}/{path}"
+    # Remove trailing slashes except for root
+    path = path.rstrip("/") or "/"
+    # Resolve . and ..
+    parts = []
+    for part in path.split("/"):
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part and part != ".":
+            parts.append(part)
+    return "/" + "/".join(parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> Callable[..., Optional["re.Match[str]"]]:
+    """Return the bound match method of pattern's fnmatch regex.
+
+    Agents glob with the same few patterns over and over, so the
+    translation and compilation are cached across calls.
+    """
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _pure_posix(path: str) -> str:
+    """Canonicalize a path string the way PurePosixPath does.
+
+    Repeated slashes and "." components are dropped, as is any trailing
+    slash; an empty path becomes ".". Two leading slashes are preserved,
+    as POSIX allows them to mean something implementation-defined.
+    """
+    if path[:1] == "/":
+        root = "//" if path[:2] == "//" and path[:3] != "///" else "/"
+    else:
+        root = ""
+    return root + "/".join(p for p in path.split("/") if p and p != ".") or "."
+
+
+def _split_root(path: str) -> Tuple[str, str]:
+    """Split a canonical path into its root ("", "/" or "//") and the rest."""
+    if path[:1] != "/":
+        return "", path
+    root = "//" if path[:2] == "//" else "/"
+    return root, path[len(root):]
 
 
 class VirtualPath:
     """Path-like object for virtual filesystem paths.
 
     Provides a subset of pathlib.Path interface for compatibility
-    with existing code that uses Path objects.
+    with existing code that uses Path objects. Paths are kept as canonical
+    POSIX strings and manipulated with string operations, matching
+    PurePosixPath's results without building a path object per call.
     """
 
+    __slots__ = ("_path", "_fs")
+
     def __init__(self, path: str, fs: "VirtualFilesystem"):
-        self._path = PurePosixPath(path)
+        self._path = _pure_posix(str(path))
         self._fs = fs
 
     def __str__(self) -> str:
-        return str(self._path)
+        return self._path
 
     def __repr__(self) -> str:
-        return f"VirtualPath({str(self._path)!r})"
+        return f"VirtualPath({self._path!r})"
 
     def __truediv__(self, other: Union[str, "VirtualPath"]) -> "VirtualPath":
-        if isinstance(other, VirtualPath):
-            other = str(other._path)
-        return VirtualPath(str(self._path / other), self._fs)
+        other = str(other)
+        if other[:1] == "/" or self._path == ".":
+            joined = other
+        elif self._path[-1] == "/":
+            joined = self._path + other
+        else:
+            joined = f"{self._path}/{other}"
+        return VirtualPath(joined, self._fs)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, VirtualPath):
-            return str(self._path) == str(other._path)
+            return self._path == other._path
         if isinstance(other, str):
-            return str(self._path) == other
+            return self._path == other
         return False
 
     def __hash__(self) -> int:
-        return hash(str(self._path))
+        return hash(self._path)
 
     @property
     def name(self) -> str:
-        return self._path.name
+        if self._path == ".":
+            return ""
+        return self._path.rpartition("/")[2]
 
     @property
     def stem(self) -> str:
-        return self._path.stem
+        name = self.name
+        i = name.rfind(".")
+        return name[:i] if 0 < i < len(name) - 1 else name
 
     @property
     def suffix(self) -> str:
-        return self._path.suffix
+        name = self.name
+        i = name.rfind(".")
+        return name[i:] if 0 < i < len(name) - 1 else ""
 
     @property
     def parent(self) -> "VirtualPath":
-        return VirtualPath(str(self._path.parent), self._fs)
+        root, rest = _split_root(self._path)
+        if not rest or rest == ".":
+            return self
+        head, sep, _ = rest.rpartition("/")
+        return VirtualPath(root + head if sep else root or ".", self._fs)
 
     @property
     def parts(self) -> tuple:
-        return self._path.parts
+        root, rest = _split_root(self._path)
+        parts = tuple(rest.split("/")) if rest and rest != "." else ()
+        return (root,) + parts if root else parts
 
     def resolve(self) -> "VirtualPath":
         """Return the path with no .. or . components."""
         # Normalize the path
         parts = []
-        for part in self._path.parts:
+        for part in self.parts:
             if part == "..":
                 if parts and parts[-1] != "/":
                     parts.pop()
@@ -80,84 +158,102 @@ class VirtualPath:
         return VirtualPath("/".join(parts) if parts[0] != "/" else "/" + "/".join(parts[1:]), self._fs)
 
     def exists(self) -> bool:
-        return self._fs.exists(str(self._path))
+        return self._fs.exists(self._path)
 
     def is_file(self) -> bool:
-        return self._fs.is_file(str(self._path))
+        return self._fs.is_file(self._path)
 
     def is_dir(self) -> bool:
-        return self._fs.is_dir(str(self._path))
+        return self._fs.is_dir(self._path)
 
     def mkdir(self, parents: bool = False, exist_ok: bool = False) -> None:
-        self._fs.mkdir(str(self._path), parents=parents, exist_ok=exist_ok)
+        self._fs.mkdir(self._path, parents=parents, exist_ok=exist_ok)
 
     def read_text(self, encoding: str = "utf-8") -> str:
-        return self._fs.read_text(str(self._path), encoding=encoding)
+        return self._fs.read_text(self._path, encoding=encoding)
 
     def read_bytes(self) -> bytes:
-        return self._fs.read_bytes(str(self._path))
+        return self._fs.read_bytes(self._path)
 
     def write_text(self, data: str, encoding: str = "utf-8") -> int:
-        return self._fs.write_text(str(self._path), data, encoding=encoding)
+        return self._fs.write_text(self._path, data, encoding=encoding)
 
     def write_bytes(self, data: bytes) -> int:
-        return self._fs.write_bytes(str(self._path), data)
+        return self._fs.write_bytes(self._path, data)
 
     def unlink(self, missing_ok: bool = False) -> None:
-        self._fs.unlink(str(self._path), missing_ok=missing_ok)
+        self._fs.unlink(self._path, missing_ok=missing_ok)
 
     def rmdir(self) -> None:
-        self._fs.rmdir(str(self._path))
+        self._fs.rmdir(self._path)
 
     def iterdir(self) -> Iterator["VirtualPath"]:
-        for name in self._fs.listdir(str(self._path)):
+        for name in self._fs.listdir(self._path):
             yield self / name
 
     def glob(self, pattern: str) -> Iterator["VirtualPath"]:
         """Simple glob implementation for virtual filesystem."""
-        for path in self._fs.glob(str(self._path), pattern):
+        for path in self._fs.glob(self._path, pattern):
             yield VirtualPath(path, self._fs)
 
     def relative_to(self, other: Union[str, "VirtualPath"]) -> "VirtualPath":
-        if isinstance(other, VirtualPath):
-            other = str(other._path)
-        return VirtualPath(str(self._path.relative_to(other)), self._fs)
+        other_parts = VirtualPath(str(other), self._fs).parts
+        parts = self.parts
+        n = len(other_parts)
+        if parts[:n] != other_parts or (n == 0 and self._path[:1] == "/"):
+            raise ValueError(
+                f"{self._path!r} is not in the subpath of {str(other)!r} "
+                "OR one path is relative and the other is absolute."
+            )
+        return VirtualPath("/".join(parts[n:]), self._fs)
 
 
 class VirtualFilesystem:
     """In-memory filesystem for session isolation.
 
     Stores files as a flat dictionary mapping paths to content.
-    Directories are tracked implicitly by path prefixes.
+    Directories are tracked in a set, with a parent -> child-names index
+    so directory listings don't scan every stored path.
     """
 
     def __init__(self, root: str = "/"):
         self._root = root.rstrip("/") or "/"
         self._files: Dict[str, bytes] = {}
         self._directories: set = {self._root}
+        self._children: Dict[str, set] = {self._root: set()}
         self._lock = threading.Lock()
         self._created_at = datetime.now()
-        self._last_accessed = datetime.now()
+        # Monotonic nanoseconds; only ever compared, never displayed
+        self._last_accessed = time.monotonic_ns()
 
     def _normalize_path(self, path: str) -> str:
         """Normalize path to absolute form within the virtual filesystem."""
-        if not path.startswith("/"):
-            path = f"{self._root}/{path}"
-        # Remove trailing slashes except for root
-        path = path.rstrip("/") or "/"
-        # Resolve . and ..
-        parts = []
-        for part in path.split("/"):
-            if part == "..":
-                if parts:
-                    parts.pop()
-            elif part and part != ".":
-                parts.append(part)
-        return "/" + "/".join(parts)
+        return _normalize_path(self._root, path)
+
+    def _link_child(self, path: str) -> None:
+        """Record path under its parent in the child index. Caller holds the lock."""
+        if path != "/":
+            parent, _, name = path.rpartition("/")
+            self._children.setdefault(parent or "/", set()).add(name)
+
+    def _unlink_child(self, path: str) -> None:
+        """Drop path from its parent's child index. Caller holds the lock."""
+        parent, _, name = path.rpartition("/")
+        siblings = self._children.get(parent or "/")
+        if siblings is not None:
+            siblings.discard(name)
+
+    def _add_directory(self, path: str) -> None:
+        """Register a directory and index it. Caller holds the lock."""
+        if path in self._directories:
+            return
+        self._directories.add(path)
+        self._children.setdefault(path, set())
+        self._link_child(path)
 
     def _touch_access(self) -> None:
         """Update last accessed time."""
-        self._last_accessed = datetime.now()
+        self._last_accessed = time.monotonic_ns()
 
     @property
     def root(self) -> VirtualPath:
@@ -216,11 +312,11 @@ class VirtualFilesystem:
                     current = ""
                     for part in parts:
                         current = f"{current}/{part}"
-                        self._directories.add(current)
+                        self._add_directory(current)
                 else:
                     raise FileNotFoundError(f"Parent directory does not exist: {parent}")
             else:
-                self._directories.add(norm_path)
+                self._add_directory(norm_path)
 
     def read_bytes(self, path: str) -> bytes:
         """Read file as bytes."""
@@ -246,6 +342,8 @@ class VirtualFilesystem:
             if parent not in self._directories:
                 raise FileNotFoundError(f"Parent directory does not exist: {parent}")
 
+            if norm_path not in self._files:
+                self._link_child(norm_path)
             self._files[norm_path] = data
             return len(data)
 
@@ -264,6 +362,8 @@ class VirtualFilesystem:
                     return
                 raise FileNotFoundError(f"File not found: {path}")
             del self._files[norm_path]
+            if norm_path not in self._directories:
+                self._unlink_child(norm_path)
 
     def rmdir(self, path: str) -> None:
         """Remove a directory (must be empty)."""
@@ -274,16 +374,13 @@ class VirtualFilesystem:
             if norm_path not in self._directories:
                 raise FileNotFoundError(f"Directory not found: {path}")
 
-            # Check if directory is empty
-            prefix = norm_path + "/"
-            for p in self._files:
-                if p.startswith(prefix):
-                    raise OSError(f"Directory not empty: {path}")
-            for p in self._directories:
-                if p.startswith(prefix):
-                    raise OSError(f"Directory not empty: {path}")
+            if self._children.get(norm_path):
+                raise OSError(f"Directory not empty: {path}")
 
             self._directories.remove(norm_path)
+            self._children.pop(norm_path, None)
+            if norm_path not in self._files:
+                self._unlink_child(norm_path)
 
     def listdir(self, path: str) -> List[str]:
         """List contents of a directory."""
@@ -294,33 +391,43 @@ class VirtualFilesystem:
             if norm_path not in self._directories:
                 raise FileNotFoundError(f"Directory not found: {path}")
 
-            prefix = norm_path + "/" if norm_path != "/" else "/"
-            prefix_len = len(prefix)
+            return sorted(self._children.get(norm_path, ()))
 
-            items = set()
+    def listdir_info(self, path: str) -> List[Tuple[str, bool, int]]:
+        """List contents of a directory along with their type and size.
 
-            # Find files in this directory
-            for p in self._files:
-                if p.startswith(prefix):
-                    remainder = p[prefix_len:]
-                    if "/" not in remainder:
-                        items.add(remainder)
+        Equivalent to listdir() followed by is_dir()/read_bytes() per entry,
+        but done in one pass under a single lock acquisition.
 
-            # Find subdirectories
-            for p in self._directories:
-                if p.startswith(prefix) and p != norm_path:
-                    remainder = p[prefix_len:]
-                    if "/" not in remainder:
-                        items.add(remainder)
+        Returns:
+            Sorted list of (name, is_dir, size) tuples. Size is 0 for directories.
+        """
+        self._touch_access()
+        norm_path = self._normalize_path(path)
 
-            return sorted(items)
+        with self._lock:
+            if norm_path not in self._directories:
+                raise FileNotFoundError(f"Directory not found: {path}")
+
+            base = "" if norm_path == "/" else norm_path
+            entries = []
+            for name in sorted(self._children.get(norm_path, ())):
+                child = f"{base}/{name}"
+                if child in self._directories:
+                    entries.append((name, True, 0))
+                else:
+                    entries.append((name, False, len(self._files[child])))
+            return entries
 
     def glob(self, path: str, pattern: str) -> List[str]:
-        """Simple glob matching within a directory."""
-        import fnmatch
+        """Simple glob matching within a directory.
 
+        The pattern is matched against each descendant's path relative to
+        path, with fnmatch semantics ("*" also matches "/").
+        """
         self._touch_access()
         norm_path = self._normalize_path(path)
+        match = _compile_glob(pattern)
 
         results = []
 
@@ -330,17 +437,13 @@ class VirtualFilesystem:
 
             # Check all files
             for p in self._files:
-                if p.startswith(prefix):
-                    remainder = p[prefix_len:]
-                    if fnmatch.fnmatch(remainder, pattern):
-                        results.append(p)
+                if p.startswith(prefix) and match(p, prefix_len):
+                    results.append(p)
 
             # Check directories
             for p in self._directories:
-                if p.startswith(prefix) and p != norm_path:
-                    remainder = p[prefix_len:]
-                    if fnmatch.fnmatch(remainder, pattern):
-                        results.append(p)
+                if p.startswith(prefix) and p != norm_path and match(p, prefix_len):
+                    results.append(p)
 
         return sorted(results)
 
@@ -375,7 +478,7 @@ class SessionManager:
                 self._sessions[session_id] = {
                     "filesystem": VirtualFilesystem(root="/workspace"),
                     "created_at": datetime.now(),
-                    "last_accessed": datetime.now(),
+                    "last_accessed": time.monotonic_ns(),
                     "agent_state": None,
                     "thread_id": str(uuid.uuid4()),
                 }
@@ -390,11 +493,14 @@ class SessionManager:
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data by ID."""
+        # Take the timestamp before locking so the critical section is just
+        # the dict lookup and two assignments
+        now = time.monotonic_ns()
         with self._lock:
             session = self._sessions.get(session_id)
             if session:
-                session["last_accessed"] = datetime.now()
-                session["filesystem"]._last_accessed = datetime.now()
+                session["last_accessed"] = now
+                session["filesystem"]._last_accessed = now
             return session
 
     def get_filesystem(self, session_id: str) -> Optional[VirtualFilesystem]:
@@ -433,13 +539,13 @@ class SessionManager:
 
     def _cleanup_expired_sessions(self) -> int:
         """Remove sessions that have been inactive too long."""
-        now = datetime.now()
+        now = time.monotonic_ns()
+        timeout_ns = self._session_timeout * 1_000_000_000
         expired = []
 
         with self._lock:
             for session_id, session in self._sessions.items():
-                last_accessed = session["last_accessed"]
-                if (now - last_accessed).total_seconds() > self._session_timeout:
+                if now - session["last_accessed"] > timeout_ns:
                     expired.append(session_id)
 
             for session_id in expired:
@@ -453,14 +559,22 @@ class SessionManager:
 
 # Global session manager instance
 _session_manager: Optional[SessionManager] = None
+_session_manager_lock = threading.Lock()
 
 
 def get_session_manager() -> SessionManager:
     """Get the global session manager instance."""
     global _session_manager
-    if _session_manager is None:
-        _session_manager = SessionManager()
-    return _session_manager
+    # Lock-free fast path once the manager exists; the lock only guards
+    # against two threads racing to create it
+    session_manager = _session_manager
+    if session_manager is not None:
+        return session_manager
+
+    with _session_manager_lock:
+        if _session_manager is None:
+            _session_manager = SessionManager()
+        return _session_manager
 
 
 def get_virtual_filesystem(session_id: str) -> Optional[VirtualFilesystem]:
@@ -3,6 +3,8 @@
 import os
 import pytest
 
+from cowork_dash.virtual_fs import get_session_manager
+
 
 @pytest.fixture
 def clean_env():
@@ -43,6 +45,30 @@ def sample_agent():
     return MockAgent()
 
 
+@pytest.fixture(scope="session")
+def empty_workspace(tmp_path_factory):
+    """Create one empty workspace directory shared by the whole session.
+
+    The path is resolved once here so tests can compare it against paths
+    run_app() resolves without calling resolve() themselves.
+    """
+    return tmp_path_factory.mktemp("ws").resolve()
+
+
+@pytest.fixture(scope="session")
+def loadable_agent_file(tmp_path_factory):
+    """Write an agent module once per session for load_agent_from_spec tests."""
+    agent_file = tmp_path_factory.mktemp("agents") / "agent.py"
+    agent_file.write_text("""
+class MyAgent:
+    def stream(self, input, stream_mode="updates"):
+        yield {"response": "test"}
+
+agent = MyAgent()
+""")
+    return agent_file
+
+
 # =============================================================================
 # CANVAS FIXTURES
 # =============================================================================
@@ -81,7 +107,6 @@ def reset_global_session_manager():
     """Reset the global session manager between tests."""
     yield
     # Clear any sessions created during tests
-    from cowork_dash.virtual_fs import get_session_manager
     sm = get_session_manager()
     for session_id in list(sm._sessions.keys()):
         sm.delete_session(session_id)
@@ -32,13 +32,27 @@ def backend(fs):
     return VirtualFilesystemBackend(fs)
 
 
+@pytest.fixture(scope="session")
+def seeded_fs_snapshot():
+    """Build the pre-existing files once and snapshot the filesystem state."""
+    seeded = VirtualFilesystem(root="/workspace")
+    seeded.write_text("/workspace/file1.txt", "content of file 1")
+    seeded.write_text("/workspace/file2.py", "print('hello')")
+    seeded.mkdir("/workspace/subdir", parents=True)
+    seeded.write_text("/workspace/subdir/nested.txt", "nested content")
+    return dict(seeded._files), set(seeded._directories), seeded._children
+
+
 @pytest.fixture
-def backend_with_files(backend, fs):
+def backend_with_files(backend, fs, seeded_fs_snapshot):
     """Create a backend with some pre-existing files."""
-    fs.write_text("/workspace/file1.txt", "content of file 1")
-    fs.write_text("/workspace/file2.py", "print('hello')")
-    fs.mkdir("/workspace/subdir", parents=True)
-    fs.write_text("/workspace/subdir/nested.txt", "nested content")
+    # File contents are immutable bytes, so shallow copies are enough to
+    # keep tests from seeing each other's writes; the child-name sets are
+    # mutable and copied individually
+    files, directories, children = seeded_fs_snapshot
+    fs._files.update(files)
+    fs._directories.update(directories)
+    fs._children.update({path: set(names) for path, names in children.items()})
     return backend
 
 
@@ -70,11 +84,21 @@ class TestPathNormalization:
         result = backend._normalize_path("/workspace/file.txt")
         assert result == "/workspace/file.txt"
 
+    def test_sibling_of_root_rewritten(self, backend):
+        """Test a path that only shares the root's prefix is moved inside root."""
+        result = backend._normalize_path("/workspacefoo/file.txt")
+        assert result == "/workspace/workspacefoo/file.txt"
+
     def test_trailing_slash_removed(self, backend):
         """Test trailing slash is removed from non-root paths."""
         result = backend._normalize_path("/workspace/subdir/")
         assert result == "/workspace/subdir"
 
+    def test_duplicate_slashes_collapsed(self, backend):
+        """Test repeated slashes are collapsed to one."""
+        result = backend._normalize_path("/workspace//subdir///file.txt")
+        assert result == "/workspace/subdir/file.txt"
+
     def test_root_trailing_slash_preserved(self, backend):
         """Test root path with trailing slash is handled."""
         result = backend._normalize_path("/workspace")
@@ -332,6 +356,29 @@ class TestGrepRaw:
         paths = [m["path"] for m in result]
         assert "/workspace/subdir/nested.txt" in paths
 
+    def test_grep_skips_binary_files(self, backend, fs):
+        """Test grep ignores non-UTF-8 files even if their bytes contain the pattern."""
+        fs.write_bytes("/workspace/blob.bin", b"\xff\xfeneedle\x00")
+        fs.write_text("/workspace/notes.txt", "first\nneedle here\n")
+
+        result = backend.grep_raw("needle")
+
+        assert result == [{"path": "/workspace/notes.txt", "line": 2, "text": "needle here"}]
+
+    def test_grep_line_numbers_across_matches(self, backend, fs):
+        """Test grep reports each matching line once with its line number."""
+        fs.write_text("/workspace/a.txt", "x\nneedle needle\n\nskip\nneedle\n")
+        fs.write_text("/workspace/b.txt", "needle\r\nskip\r\nneedle\r\n")
+
+        result = backend.grep_raw("needle")
+
+        assert [(m["path"], m["line"], m["text"]) for m in result] == [
+            ("/workspace/a.txt", 2, "needle needle"),
+            ("/workspace/a.txt", 5, "needle"),
+            ("/workspace/b.txt", 1, "needle"),
+            ("/workspace/b.txt", 3, "needle"),
+        ]
+
 
 # =============================================================================
 # GLOB TESTS
@@ -400,6 +447,18 @@ class TestUploadDownload:
         assert result[0].error is None
         assert fs.exists("/workspace/deep/nested/file.bin")
 
+    def test_upload_siblings_into_new_parent(self, backend, fs):
+        """Test several uploads sharing a missing parent all succeed."""
+        files = [
+            ("/workspace/new/a.bin", b"a"),
+            ("/workspace/new/b.bin", b"b"),
+            ("/workspace/new/c.bin", b"c"),
+        ]
+        result = backend.upload_files(files)
+
+        assert all(r.error is None for r in result)
+        assert fs.listdir("/workspace/new") == ["a.bin", "b.bin", "c.bin"]
+
     def test_download_single_file(self, backend_with_files):
         """Test downloading a single file."""
         result = backend_with_files.download_files(["/workspace/file1.txt"])
@@ -10,10 +10,12 @@ Tests cover:
 """
 
 import json
+import math
 from pathlib import Path
 
 import pytest
 
+import cowork_dash.canvas as canvas_module
 from cowork_dash.canvas import (
     parse_canvas_object,
     export_canvas_to_markdown,
@@ -23,6 +25,11 @@ from cowork_dash.canvas import (
 from cowork_dash.virtual_fs import VirtualFilesystem
 
 
+# Plotly figure seeded on disk by the file-reference tests
+_PLOTLY_FIXTURE_JSON = '{"data":[],"layout":{"title":"Test"}}'
+_PLOTLY_FIXTURE_DICT = json.loads(_PLOTLY_FIXTURE_JSON)
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
@@ -36,6 +43,18 @@ def physical_workspace(tmp_path):
     return workspace
 
 
+@pytest.fixture(scope="class")
+def canvas_dir(tmp_path_factory):
+    """Create a workspace .canvas directory shared by the tests of a class.
+
+    Tests using it write their own files and rewrite canvas.md before
+    asserting on it.
+    """
+    canvas_dir = tmp_path_factory.mktemp("canvas") / "workspace" / ".canvas"
+    canvas_dir.mkdir(parents=True)
+    return canvas_dir
+
+
 @pytest.fixture
 def virtual_workspace():
     """Create a virtual filesystem workspace."""
@@ -478,39 +497,34 @@ class TestRoundTrip:
 class TestPlotlyFileReferences:
     """Tests for Plotly file references in export/load."""
 
-    def test_export_plotly_creates_json_file(self, physical_workspace):
+    def test_export_plotly_creates_json_file(self, canvas_dir):
         """Test exporting Plotly item creates JSON file."""
         items = [{
             "id": "plotly_id",
             "type": "plotly",
             "file": "plotly_test.json",
-            "data": {"data": [], "layout": {"title": "Test"}}
+            "data": _PLOTLY_FIXTURE_DICT
         }]
 
         # First create the JSON file as parse_canvas_object would
-        canvas_dir = physical_workspace / ".canvas"
-        canvas_dir.mkdir(exist_ok=True)
-        (canvas_dir / "plotly_test.json").write_text(
-            json.dumps(items[0]["data"], indent=2)
-        )
+        (canvas_dir / "plotly_test.json").write_text(_PLOTLY_FIXTURE_JSON)
 
-        export_canvas_to_markdown(items, physical_workspace)
+        export_canvas_to_markdown(items, canvas_dir.parent)
 
         content = (canvas_dir / "canvas.md").read_text()
         assert "```plotly" in content
         assert "plotly_test.json" in content
 
-    def test_load_plotly_reads_json_file(self, physical_workspace):
+    def test_load_plotly_reads_json_file(self, canvas_dir):
         """Test loading Plotly item reads JSON file."""
-        canvas_dir = physical_workspace / ".canvas"
-        canvas_dir.mkdir()
-
         # Create the JSON file
         plotly_data = {"data": [{"x": [1, 2], "y": [3, 4]}], "layout": {}}
-        (canvas_dir / "plotly_data.json").write_text(json.dumps(plotly_data))
+        (canvas_dir / "plotly_data.json").write_text(
+            json.dumps(plotly_data, separators=(",", ":"))
+        )
 
         # Create canvas.md referencing it
-        (canvas_dir / "canvas.md").write_text("""# Canvas Export
+        (canvas_dir / "canvas.md").write_bytes(b"""# Canvas Export
 
 <!-- canvas-item: {"id": "plotly_load", "type": "plotly"} -->
 
@@ -519,9 +533,84 @@ plotly_data.json
 ```
 """)
 
-        result = load_canvas_from_markdown(physical_workspace)
+        result = load_canvas_from_markdown(canvas_dir.parent)
 
         assert len(result) == 1
         assert result[0]["type"] == "plotly"
         assert result[0]["file"] == "plotly_data.json"
         assert result[0]["data"] == plotly_data
+
+
+# =============================================================================
+# JSON BACKEND TESTS
+# =============================================================================
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(canvas_module, "orjson", None)
+    return request.param
+
+
+class TestCanvasJsonBackends:
+    """Tests that canvas JSON handling behaves the same with and without orjson."""
+
+    def test_load_plotly_file_with_nan(self, json_backend, physical_workspace):
+        """Test plotly files holding NaN, as json.dumps writes them, still load."""
+        canvas_dir = physical_workspace / ".canvas"
+        canvas_dir.mkdir()
+        (canvas_dir / "p.json").write_text(json.dumps([1.0, float("nan")], indent=2))
+        (canvas_dir / "canvas.md").write_text(
+            '<!-- canvas-item: {"id": "nan_plot", "type": "plotly"} -->\n\n'
+            "```plotly\np.json\n```\n"
+        )
+
+        result = load_canvas_from_markdown(physical_workspace)
+
+        assert len(result) == 1
+        assert result[0]["data"][0] == 1.0
+        assert math.isnan(result[0]["data"][1])
+
+    def test_parse_plotly_dict_with_non_str_key(self, json_backend, physical_workspace):
+        """Test non-str dict keys are stringified instead of failing."""
+        result = parse_canvas_object({"data": [], 1: "x"}, physical_workspace)
+
+        saved = physical_workspace / ".canvas" / result["file"]
+        assert json.loads(saved.read_text()) == {"data": [], "1": "x"}
+
+    def test_plotly_round_trip(self, json_backend, physical_workspace):
+        """Test a plotly dict survives parse, export and load."""
+        plotly_dict = {"data": [{"x": [1, 2], "y": [3.5, 4]}], "layout": {"title": "Café"}}
+
+        item = parse_canvas_object(plotly_dict, physical_workspace)
+        export_canvas_to_markdown([item], physical_workspace)
+        result = load_canvas_from_markdown(physical_workspace)
+
+        assert result[0]["data"] == plotly_dict
+
+    def test_plotly_round_trip_with_nan(self, json_backend, physical_workspace):
+        """Test NaN in a plotly dict is written as NaN and loads back as NaN."""
+        plotly_dict = {"data": [{"y": [1.0, float("nan")]}], "layout": {"title": "Café"}}
+
+        item = parse_canvas_object(plotly_dict, physical_workspace)
+        export_canvas_to_markdown([item], physical_workspace)
+        result = load_canvas_from_markdown(physical_workspace)
+
+        saved = physical_workspace / ".canvas" / item["file"]
+        assert saved.read_bytes() == json.dumps(plotly_dict, indent=2).encode("utf-8")
+        assert result[0]["data"]["data"][0]["y"][0] == 1.0
+        assert math.isnan(result[0]["data"]["data"][0]["y"][1])
+        assert result[0]["data"]["layout"] == {"title": "Café"}
+
+    def test_markers_use_default_json_separators(self, json_backend, physical_workspace):
+        """Test canvas-item markers keep json.dumps' readable default format."""
+        items = [{"id": "m1", "type": "markdown", "data": "Hi", "title": "Café"}]
+
+        export_canvas_to_markdown(items, physical_workspace)
+
+        content = (physical_workspace / ".canvas" / "canvas.md").read_text()
+        assert '<!-- canvas-item: {"id": "m1", "type": "markdown", "title": "Caf\\u00e9"} -->' in content
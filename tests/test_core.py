@@ -4,74 +4,61 @@ Core functionality tests for Cowork Dash.
 Tests the main entry points:
 - CLI argument parsing (5 tests)
 - run_app() Python API (7 tests)
-- Agent loading (3 tests)
+- Agent loading (5 tests)
 
-Total: 15 tests
+Total: 17 tests
 """
 
+import importlib
 import os
-from unittest.mock import patch
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+import cowork_dash
+import cowork_dash.app as app_module
 from cowork_dash.app import run_app, load_agent_from_spec
 from cowork_dash.cli import main
 
 
-# =============================================================================
-# CLI TESTS (5 tests)
-# =============================================================================
-
-
-def test_cli_workspace_argument(monkeypatch, tmp_path):
-    """Test CLI --workspace argument is parsed correctly."""
-    workspace = tmp_path / "test_ws"
-    workspace.mkdir()
-
-    test_args = ["cowork-dash", "run", "--workspace", str(workspace)]
-    monkeypatch.setattr("sys.argv", test_args)
-
-    with patch("cowork_dash.app.run_app") as mock_run:
-        main()
-        assert mock_run.call_args[1]["workspace"] == str(workspace)
-
-
-def test_cli_port_argument(monkeypatch):
-    """Test CLI --port argument is parsed as integer."""
-    test_args = ["cowork-dash", "run", "--port", "9999"]
-    monkeypatch.setattr("sys.argv", test_args)
-
-    with patch("cowork_dash.app.run_app") as mock_run:
-        main()
-        assert mock_run.call_args[1]["port"] == 9999
-
+@pytest.fixture(autouse=True, scope="module")
+def _no_server():
+    """Keep run_app() from starting the Dash server anywhere in this module."""
+    with patch("cowork_dash.app.app.run") as mock_run:
+        yield mock_run
 
-def test_cli_agent_argument(monkeypatch):
-    """Test CLI --agent argument is passed through."""
-    test_args = ["cowork-dash", "run", "--agent", "my_agent.py:agent"]
-    monkeypatch.setattr("sys.argv", test_args)
 
+@pytest.fixture
+def mock_run_app():
+    """Patch run_app() so CLI tests can inspect the arguments main() passes."""
     with patch("cowork_dash.app.run_app") as mock_run:
-        main()
-        assert mock_run.call_args[1]["agent_spec"] == "my_agent.py:agent"
-
+        yield mock_run
 
-def test_cli_debug_flag(monkeypatch):
-    """Test CLI --debug flag sets debug=True."""
-    test_args = ["cowork-dash", "run", "--debug"]
-    monkeypatch.setattr("sys.argv", test_args)
 
-    with patch("cowork_dash.app.run_app") as mock_run:
-        main()
-        assert mock_run.call_args[1]["debug"] is True
+# =============================================================================
+# CLI TESTS (5 tests)
+# =============================================================================
 
 
-def test_cli_title_subtitle(monkeypatch):
-    """Test CLI --title and --subtitle arguments."""
-    test_args = ["cowork-dash", "run", "--title", "My App"]
-    monkeypatch.setattr("sys.argv", test_args)
+@pytest.mark.parametrize(
+    "args, kwarg, expected",
+    [
+        (["--workspace", "my_workspace"], "workspace", "my_workspace"),
+        (["--port", "9999"], "port", 9999),
+        (["--agent", "my_agent.py:agent"], "agent_spec", "my_agent.py:agent"),
+        (["--debug"], "debug", True),
+        (["--title", "My App"], "title", "My App"),
+    ],
+    ids=["workspace", "port", "agent", "debug", "title"],
+)
+def test_cli_run_arguments(monkeypatch, mock_run_app, args, kwarg, expected):
+    """Test CLI run options are parsed and passed through to run_app()."""
+    monkeypatch.setattr("sys.argv", ["cowork-dash", "run", *args])
 
-    with patch("cowork_dash.app.run_app") as mock_run:
-        main()
-        assert mock_run.call_args[1]["title"] == "My App"
+    main()
+    assert mock_run_app.call_args[1][kwarg] == expected
 
 
 # =============================================================================
@@ -79,141 +66,110 @@ def test_cli_title_subtitle(monkeypatch):
 # =============================================================================
 
 
-def test_api_agent_instance(tmp_path, sample_agent):
+def test_api_agent_instance(empty_workspace, sample_agent):
     """Test run_app() accepts agent instance as first parameter."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
-
-    with patch("cowork_dash.app.app.run"):
-        run_app(sample_agent, workspace=str(workspace))
+    run_app(sample_agent, workspace=str(empty_workspace))
 
-        from cowork_dash.app import agent
-        assert agent is sample_agent
+    assert app_module.agent is sample_agent
 
 
-def test_api_agent_spec_priority(tmp_path, sample_agent):
+def test_api_agent_spec_priority(empty_workspace, sample_agent, loadable_agent_file):
     """Test agent_spec parameter overrides agent_instance."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
+    run_app(
+        sample_agent,  # Should be ignored
+        workspace=str(empty_workspace),
+        agent_spec=f"{loadable_agent_file}:agent"
+    )
 
-    # Create test agent file
-    agent_file = tmp_path / "test_agent.py"
-    agent_file.write_text("class Agent:\n    pass\nmy_agent = Agent()\n")
+    assert app_module.agent.__class__.__name__ == "MyAgent"
 
-    with patch("cowork_dash.app.app.run"):
-        run_app(
-            sample_agent,  # Should be ignored
-            workspace=str(workspace),
-            agent_spec=f"{agent_file}:my_agent"
-        )
 
-        from cowork_dash.app import agent
-        assert agent.__class__.__name__ == "Agent"
-
-
-def test_api_workspace_env_var(tmp_path):
+def test_api_workspace_env_var(empty_workspace, monkeypatch):
     """Test run_app() sets DEEPAGENT_WORKSPACE_ROOT environment variable."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
-
-    with patch("cowork_dash.app.app.run"):
-        # Explicitly use physical filesystem mode to ensure env var is set
-        run_app(workspace=str(workspace), virtual_fs=False)
+    # Register the variable with monkeypatch so the value run_app() writes is
+    # rolled back afterwards (delenv on an unset variable records nothing)
+    monkeypatch.setenv("DEEPAGENT_WORKSPACE_ROOT", "")
 
-        assert os.environ["DEEPAGENT_WORKSPACE_ROOT"] == str(workspace.resolve())
+    # Explicitly use physical filesystem mode to ensure env var is set
+    run_app(workspace=str(empty_workspace), virtual_fs=False)
 
+    assert os.environ["DEEPAGENT_WORKSPACE_ROOT"] == str(empty_workspace)
 
-def test_api_port_config(tmp_path):
-    """Test run_app() port parameter."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
 
-    with patch("cowork_dash.app.app.run"):
-        run_app(workspace=str(workspace), port=9000)
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"port": 9000}, {"PORT": 9000}),
+        ({"host": "0.0.0.0"}, {"HOST": "0.0.0.0"}),
+        ({"debug": True}, {"DEBUG": True}),
+        (
+            {"title": "Custom", "subtitle": "Subtitle"},
+            {"APP_TITLE": "Custom", "APP_SUBTITLE": "Subtitle"},
+        ),
+    ],
+    ids=["port", "host", "debug", "title_subtitle"],
+)
+def test_api_config(empty_workspace, kwargs, expected):
+    """Test run_app() keyword arguments update the matching app settings."""
+    run_app(workspace=str(empty_workspace), **kwargs)
 
-        from cowork_dash.app import PORT
-        assert PORT == 9000
-
-
-def test_api_host_config(tmp_path):
-    """Test run_app() host parameter."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
-
-    with patch("cowork_dash.app.app.run"):
-        run_app(workspace=str(workspace), host="0.0.0.0")
-
-        from cowork_dash.app import HOST
-        assert HOST == "0.0.0.0"
-
-
-def test_api_debug_config(tmp_path):
-    """Test run_app() debug parameter."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
-
-    with patch("cowork_dash.app.app.run"):
-        run_app(workspace=str(workspace), debug=True)
-
-        from cowork_dash.app import DEBUG
-        assert DEBUG is True
-
-
-def test_api_title_subtitle_config(tmp_path):
-    """Test run_app() title and subtitle parameters."""
-    workspace = tmp_path / "ws"
-    workspace.mkdir()
-
-    with patch("cowork_dash.app.app.run"):
-        run_app(
-            workspace=str(workspace),
-            title="Custom",
-            subtitle="Subtitle"
-        )
-
-        from cowork_dash.app import APP_TITLE, APP_SUBTITLE
-        assert APP_TITLE == "Custom"
-        assert APP_SUBTITLE == "Subtitle"
+    for name, value in expected.items():
+        assert getattr(app_module, name) == value
 
 
 # =============================================================================
-# AGENT LOADING TESTS (3 tests)
+# AGENT LOADING TESTS (5 tests)
 # =============================================================================
 
 
-def test_load_agent_invalid_file():
-    """Test loading agent from nonexistent file returns error."""
-    agent, error = load_agent_from_spec("missing.py:agent")
+@pytest.mark.parametrize(
+    "spec",
+    ["missing.py:agent", "{agent_file}:missing"],
+    ids=["missing_file", "missing_object"],
+)
+def test_load_agent_not_found(spec, loadable_agent_file):
+    """Test loading from a nonexistent file or object returns an error."""
+    agent, error = load_agent_from_spec(spec.format(agent_file=loadable_agent_file))
 
     assert agent is None
     assert error is not None
     assert "not found" in error.lower()
 
 
-def test_load_agent_missing_object(tmp_path):
-    """Test loading nonexistent object from file returns error."""
-    agent_file = tmp_path / "test.py"
-    agent_file.write_text("x = 1\n")
+def test_load_agent_success(loadable_agent_file):
+    """Test successfully loading agent from spec."""
+    loaded_agent, error = load_agent_from_spec(f"{loadable_agent_file}:agent")
 
-    agent, error = load_agent_from_spec(f"{agent_file}:missing")
+    assert loaded_agent is not None
+    assert error is None
+    assert hasattr(loaded_agent, 'stream')
 
-    assert agent is None
-    assert "not found" in error.lower()
 
+def test_agent_module_import_is_lazy(monkeypatch):
+    """Test that importing cowork_dash.agent does not build the agent."""
+    mock_create = MagicMock()
+    monkeypatch.setattr("deepagents.create_deep_agent", mock_create)
+    # Import a fresh copy; setitem first so teardown restores the original
+    monkeypatch.setitem(sys.modules, "cowork_dash.agent", sys.modules.get("cowork_dash.agent"))
+    monkeypatch.delitem(sys.modules, "cowork_dash.agent")
+    monkeypatch.setattr(cowork_dash, "agent", getattr(cowork_dash, "agent", None), raising=False)
+
+    module = importlib.import_module("cowork_dash.agent")
+
+    assert module.get_agent.cache_info().currsize == 0
+    mock_create.assert_not_called()
 
-def test_load_agent_success(tmp_path):
-    """Test successfully loading agent from spec."""
-    agent_file = tmp_path / "agent.py"
-    agent_file.write_text("""
-class MyAgent:
-    def stream(self, input, stream_mode="updates"):
-        yield {"response": "test"}
 
-agent = MyAgent()
-""")
+def test_load_agent_spec_resolves_lazy_agent(monkeypatch):
+    """Test that the agent.py:agent spec builds the agent via module __getattr__."""
+    sentinel = object()
+    mock_create = MagicMock(return_value=sentinel)
+    monkeypatch.setattr("deepagents.create_deep_agent", mock_create)
+    monkeypatch.delitem(sys.modules, "custom_agent_module", raising=False)
 
+    agent_file = Path(cowork_dash.__file__).parent / "agent.py"
     loaded_agent, error = load_agent_from_spec(f"{agent_file}:agent")
 
-    assert loaded_agent is not None
     assert error is None
-    assert hasattr(loaded_agent, 'stream')
+    assert loaded_agent is sentinel
+    mock_create.assert_called_once()
@@ -32,115 +32,114 @@ from cowork_dash.virtual_fs import VirtualFilesystem
 # =============================================================================
 
 
-@pytest.fixture
-def physical_workspace(tmp_path):
-    """Create a temporary physical workspace with files."""
-    workspace = tmp_path / "workspace"
+def _populate_physical(workspace):
+    """Create the sample files and subdirectory in a physical workspace."""
     workspace.mkdir()
 
     # Create some files
-    (workspace / "readme.md").write_text("# Readme")
-    (workspace / "script.py").write_text("print('hello')")
-    (workspace / "data.csv").write_text("a,b\n1,2")
+    (workspace / "readme.md").write_bytes(b"# Readme")
+    (workspace / "script.py").write_bytes(b"print('hello')")
+    (workspace / "data.csv").write_bytes(b"a,b\n1,2")
     (workspace / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n")
 
     # Create subdirectory
     subdir = workspace / "src"
     subdir.mkdir()
-    (subdir / "main.py").write_text("def main(): pass")
+    (subdir / "main.py").write_bytes(b"def main(): pass")
 
     return workspace
 
 
-@pytest.fixture
-def virtual_workspace():
-    """Create a virtual filesystem with files."""
-    fs = VirtualFilesystem(root="/workspace")
-
-    fs.write_text("/workspace/readme.md", "# Readme")
-    fs.write_text("/workspace/script.py", "print('hello')")
-    fs.write_text("/workspace/data.csv", "a,b\n1,2")
-    fs.write_bytes("/workspace/image.png", b"\x89PNG\r\n\x1a\n")
-
-    fs.mkdir("/workspace/src", parents=True)
-    fs.write_text("/workspace/src/main.py", "def main(): pass")
-
+_VFS_SEED = {
+    "/workspace/readme.md": "# Readme",
+    "/workspace/script.py": "print('hello')",
+    "/workspace/data.csv": "a,b\n1,2",
+    "/workspace/image.png": b"\x89PNG\r\n\x1a\n",
+    "/workspace/src/main.py": "def main(): pass",
+}
+
+
+def _seed_vfs(fs, seed):
+    """Write seed files into fs, creating each parent directory once."""
+    created = set()
+    for path, data in seed.items():
+        parent = path.rpartition("/")[0] or "/"
+        if parent not in created:
+            fs.mkdir(parent, parents=True, exist_ok=True)
+            created.add(parent)
+        if isinstance(data, bytes):
+            fs.write_bytes(path, data)
+        else:
+            fs.write_text(path, data)
     return fs
 
 
-# =============================================================================
-# IS_TEXT_FILE TESTS
-# =============================================================================
-
-
-class TestIsTextFile:
-    """Tests for is_text_file function."""
-
-    def test_python_files_are_text(self):
-        """Test .py files are recognized as text."""
-        assert is_text_file("script.py") is True
-
-    def test_markdown_files_are_text(self):
-        """Test .md files are recognized as text."""
-        assert is_text_file("readme.md") is True
-
-    def test_json_files_are_text(self):
-        """Test .json files are recognized as text."""
-        assert is_text_file("config.json") is True
+def _populate_virtual():
+    """Create a virtual filesystem with the sample files."""
+    return _seed_vfs(VirtualFilesystem(root="/workspace"), _VFS_SEED)
 
-    def test_csv_files_are_text(self):
-        """Test .csv files are recognized as text."""
-        assert is_text_file("data.csv") is True
 
-    def test_html_files_are_text(self):
-        """Test .html files are recognized as text."""
-        assert is_text_file("index.html") is True
+@pytest.fixture(scope="module")
+def physical_workspace_ro(tmp_path_factory):
+    """Physical workspace shared by the tests of this module that only read it."""
+    return _populate_physical(tmp_path_factory.mktemp("ro") / "workspace")
 
-    def test_css_files_are_text(self):
-        """Test .css files are recognized as text."""
-        assert is_text_file("styles.css") is True
 
-    def test_js_files_are_text(self):
-        """Test .js files are recognized as text."""
-        assert is_text_file("app.js") is True
+@pytest.fixture(scope="module")
+def virtual_workspace_ro():
+    """Virtual filesystem shared by the tests of this module that only read it."""
+    return _populate_virtual()
 
-    def test_ts_files_are_text(self):
-        """Test .ts files are recognized as text."""
-        assert is_text_file("app.ts") is True
 
-    def test_yaml_files_are_text(self):
-        """Test .yaml and .yml files are recognized as text."""
-        assert is_text_file("config.yaml") is True
-        assert is_text_file("config.yml") is True
+@pytest.fixture
+def physical_workspace(tmp_path):
+    """Create a temporary physical workspace with files, for tests that modify it."""
+    return _populate_physical(tmp_path / "workspace")
 
-    def test_txt_files_are_text(self):
-        """Test .txt files are recognized as text."""
-        assert is_text_file("notes.txt") is True
 
-    def test_no_extension_is_text(self):
-        """Test files without extension are treated as text."""
-        assert is_text_file("Makefile") is True
-        assert is_text_file("Dockerfile") is True
+@pytest.fixture
+def virtual_workspace():
+    """Create a virtual filesystem with files, for tests that modify it."""
+    return _populate_virtual()
 
-    def test_png_files_are_not_text(self):
-        """Test .png files are not recognized as text."""
-        assert is_text_file("image.png") is False
 
-    def test_jpg_files_are_not_text(self):
-        """Test .jpg files are not recognized as text."""
-        assert is_text_file("photo.jpg") is False
+# =============================================================================
+# IS_TEXT_FILE TESTS
+# =============================================================================
 
-    def test_pdf_files_are_not_text(self):
-        """Test .pdf files are not recognized as text."""
-        assert is_text_file("document.pdf") is False
 
-    def test_zip_files_are_not_text(self):
-        """Test .zip files are not recognized as text."""
-        assert is_text_file("archive.zip") is False
+class TestIsTextFile:
+    """Tests for is_text_file function."""
 
-    def test_exe_files_are_not_text(self):
-        """Test .exe files are not recognized as text."""
-        assert is_text_file("program.exe") is False
+    @pytest.mark.parametrize("filename", [
+        "script.py",
+        "readme.md",
+        "config.json",
+        "data.csv",
+        "index.html",
+        "styles.css",
+        "app.js",
+        "app.ts",
+        "config.yaml",
+        "config.yml",
+        "notes.txt",
+        "Makefile",  # No extension
+        "Dockerfile",
+    ])
+    def test_text_files(self, filename):
+        """Test text extensions and extensionless files are recognized as text."""
+        assert is_text_file(filename) is True
+
+    @pytest.mark.parametrize("filename", [
+        "image.png",
+        "photo.jpg",
+        "document.pdf",
+        "archive.zip",
+        "program.exe",
+    ])
+    def test_binary_files_are_not_text(self, filename):
+        """Test binary extensions are not recognized as text."""
+        assert is_text_file(filename) is False
 
 
 # =============================================================================
@@ -151,52 +150,52 @@ class TestIsTextFile:
 class TestBuildFileTreePhysical:
     """Tests for build_file_tree with physical filesystem."""
 
-    def test_returns_list(self, physical_workspace):
+    def test_returns_list(self, physical_workspace_ro):
         """Test build_file_tree returns a list."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         assert isinstance(result, list)
 
-    def test_includes_files(self, physical_workspace):
+    def test_includes_files(self, physical_workspace_ro):
         """Test result includes files."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         names = [item["name"] for item in result]
 
         assert "readme.md" in names
         assert "script.py" in names
 
-    def test_includes_directories(self, physical_workspace):
+    def test_includes_directories(self, physical_workspace_ro):
         """Test result includes directories."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         dirs = [item for item in result if item["type"] == "folder"]
         dir_names = [d["name"] for d in dirs]
 
         assert "src" in dir_names
 
-    def test_file_items_have_viewable_flag(self, physical_workspace):
+    def test_file_items_have_viewable_flag(self, physical_workspace_ro):
         """Test file items have viewable flag."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         files = [item for item in result if item["type"] == "file"]
 
         for f in files:
             assert "viewable" in f
 
-    def test_text_files_are_viewable(self, physical_workspace):
+    def test_text_files_are_viewable(self, physical_workspace_ro):
         """Test text files are marked as viewable."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         readme = next(item for item in result if item["name"] == "readme.md")
 
         assert readme["viewable"] is True
 
-    def test_binary_files_not_viewable(self, physical_workspace):
+    def test_binary_files_not_viewable(self, physical_workspace_ro):
         """Test binary files are not marked as viewable."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         image = next(item for item in result if item["name"] == "image.png")
 
         assert image["viewable"] is False
 
-    def test_folders_have_has_children(self, physical_workspace):
+    def test_folders_have_has_children(self, physical_workspace_ro):
         """Test folders have has_children flag."""
-        result = build_file_tree(physical_workspace, physical_workspace)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro)
         src = next(item for item in result if item["name"] == "src")
 
         assert "has_children" in src
@@ -211,17 +210,17 @@ class TestBuildFileTreePhysical:
 
         assert ".hidden" not in names
 
-    def test_lazy_load_doesnt_recurse(self, physical_workspace):
+    def test_lazy_load_doesnt_recurse(self, physical_workspace_ro):
         """Test lazy_load=True doesn't load children."""
-        result = build_file_tree(physical_workspace, physical_workspace, lazy_load=True)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro, lazy_load=True)
         src = next(item for item in result if item["name"] == "src")
 
         # Children should be empty list in lazy mode
         assert src["children"] == []
 
-    def test_non_lazy_load_recurses(self, physical_workspace):
+    def test_non_lazy_load_recurses(self, physical_workspace_ro):
         """Test lazy_load=False loads children."""
-        result = build_file_tree(physical_workspace, physical_workspace, lazy_load=False)
+        result = build_file_tree(physical_workspace_ro, physical_workspace_ro, lazy_load=False)
         src = next(item for item in result if item["name"] == "src")
 
         # Children should be populated
@@ -238,22 +237,22 @@ class TestBuildFileTreePhysical:
 class TestBuildFileTreeVirtual:
     """Tests for build_file_tree with virtual filesystem."""
 
-    def test_works_with_virtual_fs(self, virtual_workspace):
+    def test_works_with_virtual_fs(self, virtual_workspace_ro):
         """Test build_file_tree works with VirtualFilesystem."""
-        result = build_file_tree(virtual_workspace.root, virtual_workspace)
+        result = build_file_tree(virtual_workspace_ro.root, virtual_workspace_ro)
         assert isinstance(result, list)
 
-    def test_includes_virtual_files(self, virtual_workspace):
+    def test_includes_virtual_files(self, virtual_workspace_ro):
         """Test result includes files from virtual filesystem."""
-        result = build_file_tree(virtual_workspace.root, virtual_workspace)
+        result = build_file_tree(virtual_workspace_ro.root, virtual_workspace_ro)
         names = [item["name"] for item in result]
 
         assert "readme.md" in names
         assert "script.py" in names
 
-    def test_includes_virtual_directories(self, virtual_workspace):
+    def test_includes_virtual_directories(self, virtual_workspace_ro):
         """Test result includes directories from virtual filesystem."""
-        result = build_file_tree(virtual_workspace.root, virtual_workspace)
+        result = build_file_tree(virtual_workspace_ro.root, virtual_workspace_ro)
         dirs = [item for item in result if item["type"] == "folder"]
         dir_names = [d["name"] for d in dirs]
 
@@ -268,16 +267,16 @@ class TestBuildFileTreeVirtual:
 class TestLoadFolderContents:
     """Tests for load_folder_contents function."""
 
-    def test_loads_subfolder_physical(self, physical_workspace):
+    def test_loads_subfolder_physical(self, physical_workspace_ro):
         """Test loading subfolder contents with physical filesystem."""
-        result = load_folder_contents("src", physical_workspace)
+        result = load_folder_contents("src", physical_workspace_ro)
 
         names = [item["name"] for item in result]
         assert "main.py" in names
 
-    def test_loads_subfolder_virtual(self, virtual_workspace):
+    def test_loads_subfolder_virtual(self, virtual_workspace_ro):
         """Test loading subfolder contents with virtual filesystem."""
-        result = load_folder_contents("src", virtual_workspace)
+        result = load_folder_contents("src", virtual_workspace_ro)
 
         names = [item["name"] for item in result]
         assert "main.py" in names
@@ -291,33 +290,33 @@ class TestLoadFolderContents:
 class TestReadFileContent:
     """Tests for read_file_content function."""
 
-    def test_read_text_file_physical(self, physical_workspace):
+    def test_read_text_file_physical(self, physical_workspace_ro):
         """Test reading text file from physical filesystem."""
-        content, is_text, error = read_file_content(physical_workspace, "readme.md")
+        content, is_text, error = read_file_content(physical_workspace_ro, "readme.md")
 
         assert content == "# Readme"
         assert is_text is True
         assert error is None
 
-    def test_read_text_file_virtual(self, virtual_workspace):
+    def test_read_text_file_virtual(self, virtual_workspace_ro):
         """Test reading text file from virtual filesystem."""
-        content, is_text, error = read_file_content(virtual_workspace, "readme.md")
+        content, is_text, error = read_file_content(virtual_workspace_ro, "readme.md")
 
         assert content == "# Readme"
         assert is_text is True
         assert error is None
 
-    def test_read_binary_file_returns_error(self, physical_workspace):
+    def test_read_binary_file_returns_error(self, physical_workspace_ro):
         """Test reading binary file returns appropriate error."""
-        content, is_text, error = read_file_content(physical_workspace, "image.png")
+        content, is_text, error = read_file_content(physical_workspace_ro, "image.png")
 
         assert content is None
         assert is_text is False
         assert error is not None
 
-    def test_read_nonexistent_file(self, physical_workspace):
+    def test_read_nonexistent_file(self, physical_workspace_ro):
         """Test reading nonexistent file returns error."""
-        content, is_text, error = read_file_content(physical_workspace, "missing.txt")
+        content, is_text, error = read_file_content(physical_workspace_ro, "missing.txt")
 
         assert content is None
         assert is_text is False
@@ -414,45 +413,45 @@ class TestCreateDirectory:
 class TestGetFileDownloadData:
     """Tests for get_file_download_data function."""
 
-    def test_download_text_file_physical(self, physical_workspace):
+    def test_download_text_file_physical(self, physical_workspace_ro):
         """Test getting download data for text file."""
-        b64, filename, mime = get_file_download_data(physical_workspace, "readme.md")
+        b64, filename, mime = get_file_download_data(physical_workspace_ro, "readme.md")
 
         assert b64 is not None
         assert filename == "readme.md"
         assert mime == "text/markdown"
 
-    def test_download_text_file_virtual(self, virtual_workspace):
+    def test_download_text_file_virtual(self, virtual_workspace_ro):
         """Test getting download data for text file from virtual fs."""
-        b64, filename, mime = get_file_download_data(virtual_workspace, "readme.md")
+        b64, filename, mime = get_file_download_data(virtual_workspace_ro, "readme.md")
 
         assert b64 is not None
         assert filename == "readme.md"
 
-    def test_download_binary_file(self, physical_workspace):
+    def test_download_binary_file(self, physical_workspace_ro):
         """Test getting download data for binary file."""
-        b64, filename, mime = get_file_download_data(physical_workspace, "image.png")
+        b64, filename, mime = get_file_download_data(physical_workspace_ro, "image.png")
 
         assert b64 is not None
         assert filename == "image.png"
         assert mime == "image/png"
 
-    def test_download_nonexistent_file(self, physical_workspace):
+    def test_download_nonexistent_file(self, physical_workspace_ro):
         """Test getting download data for nonexistent file."""
-        b64, filename, mime = get_file_download_data(physical_workspace, "missing.txt")
+        b64, filename, mime = get_file_download_data(physical_workspace_ro, "missing.txt")
 
         assert b64 is None
         assert filename is None
         assert mime is None
 
-    def test_download_csv_mime_type(self, physical_workspace):
+    def test_download_csv_mime_type(self, physical_workspace_ro):
         """Test CSV file has correct MIME type."""
-        b64, filename, mime = get_file_download_data(physical_workspace, "data.csv")
+        b64, filename, mime = get_file_download_data(physical_workspace_ro, "data.csv")
 
         assert mime == "text/csv"
 
-    def test_download_python_mime_type(self, physical_workspace):
+    def test_download_python_mime_type(self, physical_workspace_ro):
         """Test Python file has correct MIME type."""
-        b64, filename, mime = get_file_download_data(physical_workspace, "script.py")
+        b64, filename, mime = get_file_download_data(physical_workspace_ro, "script.py")
 
         assert mime == "text/x-python"
@@ -0,0 +1,36 @@
+"""
+Tests for agent tools.
+
+Tests cover:
+- bash output decoding
+"""
+
+import pytest
+
+from cowork_dash import tools
+
+
+@pytest.fixture
+def physical_bash(monkeypatch, tmp_path):
+    """Run the bash tool in physical filesystem mode inside tmp_path."""
+    monkeypatch.setattr(tools, "VIRTUAL_FS", False)
+    monkeypatch.setattr(tools, "WORKSPACE_ROOT", tmp_path)
+    return tools.bash
+
+
+class TestBash:
+    """Tests for the bash tool."""
+
+    def test_invalid_utf8_output_is_replaced(self, physical_bash):
+        """Test non-UTF-8 output is decoded with replacement characters."""
+        result = physical_bash("printf 'ok \\377'")
+
+        assert result["status"] == "success"
+        assert result["stdout"] == "ok \ufffd"
+
+    def test_crlf_output_is_normalized(self, physical_bash):
+        """Test CRLF and lone CR line endings are translated to LF."""
+        result = physical_bash("printf 'a\\r\\nb\\rc\\n'")
+
+        assert result["status"] == "success"
+        assert result["stdout"] == "a\nb\nc\n"
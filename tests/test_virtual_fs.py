@@ -10,7 +10,7 @@ Tests cover:
 """
 
 import threading
-import time
+from pathlib import PurePosixPath
 
 import pytest
 
@@ -125,6 +125,22 @@ class TestVirtualFilesystem:
         with pytest.raises(FileNotFoundError):
             fs.listdir("/missing")
 
+    def test_listdir_info_returns_type_and_size(self):
+        """Test listdir_info returns (name, is_dir, size) for each entry."""
+        fs = VirtualFilesystem()
+        fs.write_text("/a.txt", "abc")
+        fs.mkdir("/subdir")
+        fs.write_text("/subdir/nested.txt", "nested")
+
+        entries = fs.listdir_info("/")
+        assert entries == [("a.txt", False, 3), ("subdir", True, 0)]
+
+    def test_listdir_info_nonexistent_raises(self):
+        """Test listdir_info on nonexistent directory raises."""
+        fs = VirtualFilesystem()
+        with pytest.raises(FileNotFoundError):
+            fs.listdir_info("/missing")
+
     def test_unlink_file(self):
         """Test unlink removes a file."""
         fs = VirtualFilesystem()
@@ -139,6 +155,21 @@ class TestVirtualFilesystem:
         fs.rmdir("/emptydir")
         assert not fs.exists("/emptydir")
 
+    def test_rmdir_non_empty_raises_until_emptied(self):
+        """Test rmdir refuses a non-empty directory and listings track removals."""
+        fs = VirtualFilesystem()
+        fs.mkdir("/dir")
+        fs.write_text("/dir/file.txt", "content")
+
+        with pytest.raises(OSError):
+            fs.rmdir("/dir")
+
+        fs.unlink("/dir/file.txt")
+        assert fs.listdir("/dir") == []
+
+        fs.rmdir("/dir")
+        assert "dir" not in fs.listdir("/")
+
     def test_unlink_nonexistent_raises(self):
         """Test unlink on nonexistent path raises."""
         fs = VirtualFilesystem()
@@ -233,6 +264,27 @@ class TestVirtualPath:
         vp = fs.path("/file.txt")
         assert vp.suffix == ".txt"
 
+    @pytest.mark.parametrize("path", [
+        "/", "/subdir/", "//a//b/./c.tar.gz", "relative/x.", "/.hidden", "",
+    ])
+    def test_matches_pure_posix_path(self, path):
+        """Test string-based path handling agrees with PurePosixPath."""
+        fs = VirtualFilesystem()
+        vp = fs.path(path)
+        pp = PurePosixPath(path)
+
+        assert str(vp) == str(pp)
+        assert (vp.name, vp.stem, vp.suffix, vp.parts) == (pp.name, pp.stem, pp.suffix, pp.parts)
+        assert str(vp.parent) == str(pp.parent)
+        assert str(vp / "child") == str(pp / "child")
+
+    def test_relative_to_outside_raises(self):
+        """Test relative_to raises ValueError for a path outside other."""
+        fs = VirtualFilesystem()
+        assert str(fs.path("/a/b/c").relative_to("/a")) == "b/c"
+        with pytest.raises(ValueError):
+            fs.path("/a/b").relative_to("/c")
+
     def test_exists_method(self):
         """Test exists() method on VirtualPath."""
         fs = VirtualFilesystem()
@@ -372,8 +424,9 @@ class TestSessionManager:
         sm = SessionManager()
         sm.create_session("test-session")
 
+        # Backdate the access time instead of sleeping past the clock's resolution
+        sm._sessions["test-session"]["last_accessed"] -= 1_000_000_000
         initial_time = sm._sessions["test-session"]["last_accessed"]
-        time.sleep(0.01)  # Small delay
         sm.get_session("test-session")  # This touches the session
         updated_time = sm._sessions["test-session"]["last_accessed"]
 